@@ -1,4 +1,5 @@
 import os
+import threading
 import warnings
 from pathlib import Path
 
@@ -9,6 +10,7 @@ import joblib  # pyright: ignore[reportMissingImports]
 import numpy as np  # pyright: ignore[reportMissingImports]
 
 from heuristics import heuristic_predict
+from warmup import run_warmup
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -59,6 +61,47 @@ def load_model():
 
 MODEL = load_model()
 
+# Readiness flips only after a successful warm-up; liveness is reported independently
+READINESS = {"ready": False, "warmupSeconds": None, "warmupError": None}
+
+WARMUP_ON_START = os.environ.get("WARMUP_ON_START", "true").lower() != "false"
+
+# Warm-up is per process: a forked worker does not inherit the parent's thread
+_WARMUP_LOCK = threading.Lock()
+_WARMUP_PID = None
+
+
+def warm_up():
+    """Run the warm-up corpus and mark the service ready if it succeeded."""
+    try:
+        result = run_warmup(MODEL)
+    except Exception as exc:
+        app.logger.error("Warm-up failed: %s", exc, exc_info=True)
+        READINESS["warmupError"] = {"warmup": f"{type(exc).__name__}: {exc}"}
+        return
+
+    READINESS["warmupSeconds"] = result["seconds"]
+    if result["errors"]:
+        app.logger.error("Warm-up failed for %s", result["errors"])
+        READINESS["warmupError"] = result["errors"]
+        return
+
+    app.logger.info("✓ Warm-up completed in %.3fs", result["seconds"])
+    READINESS["ready"] = True
+
+
+def start_warmup():
+    """Start warm-up in a background thread once per serving process."""
+    global _WARMUP_PID
+    if _WARMUP_PID == os.getpid():
+        return
+    with _WARMUP_LOCK:
+        if _WARMUP_PID == os.getpid():
+            return
+        _WARMUP_PID = os.getpid()
+        READINESS.update(ready=False, warmupSeconds=None, warmupError=None)
+    threading.Thread(target=warm_up, name="classifier-warmup", daemon=True).start()
+
 
 def get_prediction_confidence(model_pipeline, text: str):
     """Calculate prediction confidence using predict_proba."""
@@ -206,14 +249,33 @@ def predict():
 
 @app.get("/health")
 def health():
-    """Health check endpoint."""
+    """Health check endpoint (liveness plus readiness details)."""
     return jsonify({
         "status": "ok",
+        "ready": READINESS["ready"],
+        "warmupSeconds": READINESS["warmupSeconds"],
+        "warmupError": READINESS["warmupError"],
         "modelLoaded": MODEL is not None,
         "modelPath": str(MODEL_PATH) if MODEL_PATH.exists() else None
     }), 200
 
 
+@app.get("/health/ready")
+def ready():
+    """Readiness probe: 503 until warm-up has finished successfully."""
+    if not READINESS["ready"]:
+        return jsonify({
+            "status": "warmup-failed" if READINESS["warmupError"] else "warming-up",
+            "ready": False,
+            "warmupError": READINESS["warmupError"]
+        }), 503
+    return jsonify({
+        "status": "ready",
+        "ready": True,
+        "warmupSeconds": READINESS["warmupSeconds"]
+    }), 200
+
+
 @app.get("/")
 def root():
     """Root endpoint with API information."""
@@ -222,12 +284,20 @@ def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /predict": "Classify task description",
-            "GET /health": "Health check"
+            "GET /health": "Health check",
+            "GET /health/ready": "Readiness check (after warm-up)"
         },
-        "modelLoaded": MODEL is not None
+        "modelLoaded": MODEL is not None,
+        "ready": READINESS["ready"]
     }), 200
 
 
+# Warm up each serving process as it starts. The debug reloader's watcher
+# process never serves, so only its child (WERKZEUG_RUN_MAIN) warms up.
+if WARMUP_ON_START and (__name__ != "__main__" or os.environ.get("WERKZEUG_RUN_MAIN") == "true"):
+    start_warmup()
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     app.logger.info("Starting classifier service on port %d", port)
@@ -0,0 +1,55 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The service modules import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Tests drive warm-up explicitly instead of racing a background thread
+os.environ["WARMUP_ON_START"] = "false"
+
+
+class FakePipeline:
+    """Stand-in for a trained sklearn pipeline that records its calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, texts):
+        self.calls.append(("predict", len(texts)))
+        return ["medium"] * len(texts)
+
+    def predict_proba(self, texts):
+        self.calls.append(("predict_proba", len(texts)))
+        return [[0.2, 0.3, 0.5] for _ in texts]
+
+
+class NoProbaPipeline:
+    """Pipeline whose estimator does not support predict_proba."""
+
+    def predict(self, texts):
+        return ["medium"] * len(texts)
+
+
+class BrokenPipeline:
+    """Pipeline whose predict raises, as /predict would also hit."""
+
+    def predict(self, texts):
+        raise ValueError("model is broken")
+
+
+@pytest.fixture
+def fake_model():
+    return {"priority": FakePipeline(), "status": FakePipeline()}
+
+
+@pytest.fixture
+def no_proba_model():
+    return {"priority": NoProbaPipeline(), "status": FakePipeline()}
+
+
+@pytest.fixture
+def failing_model():
+    return {"priority": BrokenPipeline(), "status": FakePipeline()}
@@ -0,0 +1,93 @@
+import pytest
+
+import app as service
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(service, "READINESS", {"ready": False, "warmupSeconds": None, "warmupError": None})
+    return service.app.test_client()
+
+
+def test_ready_returns_503_before_warmup(client):
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.get_json()["status"] == "warming-up"
+
+
+def test_health_is_live_during_warmup(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ok"
+    assert response.get_json()["ready"] is False
+
+
+def test_ready_returns_200_after_warmup(client, fake_model, monkeypatch):
+    monkeypatch.setattr(service, "MODEL", fake_model)
+
+    service.warm_up()
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.get_json()["ready"] is True
+    assert response.get_json()["warmupSeconds"] is not None
+
+
+def test_ready_stays_503_when_warmup_fails(client, failing_model, monkeypatch):
+    monkeypatch.setattr(service, "MODEL", failing_model)
+
+    service.warm_up()
+    ready = client.get("/health/ready")
+    health = client.get("/health")
+
+    assert ready.status_code == 503
+    assert ready.get_json()["status"] == "warmup-failed"
+    assert ready.get_json()["warmupError"] == {"priority": "ValueError: model is broken"}
+    assert health.status_code == 200
+    assert health.get_json()["ready"] is False
+
+
+def test_ready_after_warmup_without_predict_proba(client, no_proba_model, monkeypatch):
+    monkeypatch.setattr(service, "MODEL", no_proba_model)
+
+    service.warm_up()
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+
+
+def test_warmup_exception_reports_error_dict(client, monkeypatch):
+    def explode(model):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, "run_warmup", explode)
+
+    service.warm_up()
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.get_json()["warmupError"] == {"warmup": "RuntimeError: boom"}
+
+
+def test_start_warmup_is_idempotent_per_process(monkeypatch):
+    started = []
+
+    class RecordingThread:
+        def __init__(self, target, **kwargs):
+            self.target = target
+
+        def start(self):
+            started.append(self.target)
+
+    readiness = {"ready": True, "warmupSeconds": 0.1, "warmupError": None}
+    monkeypatch.setattr(service, "_WARMUP_PID", None)
+    monkeypatch.setattr(service, "READINESS", readiness)
+    monkeypatch.setattr(service.threading, "Thread", RecordingThread)
+
+    service.start_warmup()
+    service.start_warmup()
+
+    assert started == [service.warm_up]
+    assert readiness == {"ready": False, "warmupSeconds": None, "warmupError": None}
@@ -0,0 +1,35 @@
+from warmup import WARMUP_CORPUS, run_warmup
+
+
+def test_run_warmup_without_model_warms_heuristics():
+    result = run_warmup(None)
+
+    assert result["errors"] == {}
+    assert result["seconds"] >= 0
+
+
+def test_run_warmup_uses_single_item_calls_per_head(fake_model):
+    result = run_warmup(fake_model)
+
+    assert result["errors"] == {}
+    for pipeline in fake_model.values():
+        assert len(pipeline.calls) == 2 * len(WARMUP_CORPUS)
+        assert all(size == 1 for _, size in pipeline.calls)
+
+
+def test_run_warmup_failing_head_does_not_skip_other_head(failing_model, monkeypatch):
+    warmed = []
+    monkeypatch.setattr("warmup.heuristic_predict", warmed.append)
+
+    result = run_warmup(failing_model)
+
+    assert list(result["errors"]) == ["priority"]
+    assert result["errors"]["priority"] == "ValueError: model is broken"
+    assert len(failing_model["status"].calls) == 2 * len(WARMUP_CORPUS)
+    assert warmed == WARMUP_CORPUS
+
+
+def test_run_warmup_tolerates_missing_predict_proba(no_proba_model):
+    result = run_warmup(no_proba_model)
+
+    assert result["errors"] == {}
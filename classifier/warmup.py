@@ -0,0 +1,69 @@
+"""Startup warm-up for the classifier service.
+
+Runs a representative corpus through both model heads and the heuristics so
+the first real /predict calls don't pay for lazy numpy/scipy code paths.
+"""
+
+import time
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+from heuristics import heuristic_predict
+
+# Representative task descriptions covering every priority/status combination
+WARMUP_CORPUS = [
+    "Server outage impacting all clients",
+    "Urgent: Fix payment processing bug",
+    "Critical bug in checkout process",
+    "Deployed hotfix for login authentication",
+    "Implement user profile page",
+    "Design API specification for notifications",
+    "Refactor authentication middleware",
+    "Plan sprint goals for next quarter",
+    "Finished code review for search feature",
+    "Research new charting libraries",
+    "Cleanup unused CSS classes",
+    "Write release notes for version 2.1",
+    "Completed documentation for onboarding",
+    "Explore dark mode idea for later",
+    "Working on integration tests for tasks API",
+    "Investigate slow dashboard load times",
+]
+
+
+def _warm_head(pipeline, corpus):
+    """Mirror the single-item calls /predict makes on one model head."""
+    for text in corpus:
+        pipeline.predict([text])
+        # /predict falls back to a fixed confidence when predict_proba fails
+        try:
+            proba = pipeline.predict_proba([text])[0]
+            float(np.max(proba))
+        except Exception:
+            pass
+
+
+def run_warmup(model=None, corpus=WARMUP_CORPUS):
+    """Warm up the model heads and heuristics.
+
+    Returns a dict with the elapsed ``seconds`` and any per-head ``errors``.
+    A head whose ``predict`` fails does not stop the other head or the
+    heuristics.
+    """
+    started = time.perf_counter()
+    errors = {}
+
+    if model:
+        for head in ("priority", "status"):
+            try:
+                _warm_head(model[head], corpus)
+            except Exception as exc:
+                errors[head] = f"{type(exc).__name__}: {exc}"
+
+    for text in corpus:
+        heuristic_predict(text)
+
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "errors": errors
+    }